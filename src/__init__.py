@@ -1,49 +1,170 @@
+import atexit
+import copy
+import io
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
+from typing import Optional, cast
+from zoneinfo import ZoneInfo
 
-import dotenv
-import pytz
-from rich.logging import RichHandler
 
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-dotenv.load_dotenv()
+dotenv_path = os.path.join(project_dir, ".env")
+if os.path.exists(dotenv_path):
+    import dotenv
+
+    dotenv.load_dotenv(dotenv_path)
 
-project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.environ["PROJECT_DIR"] = project_dir
-sys.path.append(project_dir)
+if project_dir not in sys.path:
+    sys.path.append(project_dir)
+
+
+def _ensure_dir(path: str) -> None:
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
 
 
 parent_reports_dir = os.path.join(project_dir, "reports")
-os.makedirs(parent_reports_dir, exist_ok=True)
+_ensure_dir(parent_reports_dir)
+
+log_listener: Optional[logging.handlers.QueueListener] = None
+
+_LOG_FORMAT = (
+    "%(asctime)s %(levelname)s %(name)s %(filename)s %(funcName)s : %(message)s"
+)
+_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_FORMATTER = logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATE_FORMAT)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    def __init__(
+        self,
+        filename: str,
+        encoding: Optional[str] = None,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.ERROR,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, encoding=encoding, delay=True)
+
+    def _open(self) -> io.TextIOWrapper:
+        _ensure_dir(os.path.dirname(self.baseFilename))
+        return cast(
+            io.TextIOWrapper,
+            open(
+                self.baseFilename,
+                self.mode,
+                buffering=self.buffer_size,
+                encoding=self.encoding,
+                errors=self.errors,
+            ),
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class PeriodicMemoryHandler(logging.handlers.MemoryHandler):
+    def __init__(
+        self,
+        capacity: int,
+        flushLevel: int = logging.ERROR,
+        target: Optional[logging.Handler] = None,
+        flushOnClose: bool = True,
+        flush_interval: float = 5.0,
+    ) -> None:
+        super().__init__(
+            capacity, flushLevel=flushLevel, target=target, flushOnClose=flushOnClose
+        )
+        self.flush_interval = flush_interval
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flushing = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # The flusher starts with the first record, so processes that never
+        # log don't get a thread.
+        if self._flusher is None:
+            self.acquire()
+            try:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_periodically, daemon=True
+                    )
+                    self._flusher.start()
+            finally:
+                self.release()
+        super().emit(record)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+            if self.target is not None:
+                self.target.flush()
+
+    def close(self) -> None:
+        self._stop_flushing.set()
+        super().close()
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, only merge the arguments into the
+        # message (they may change after this call returns) and leave the
+        # formatting and exc_info to the handlers on the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def setup_logger(project_root: str) -> str:
-    today = datetime.now(pytz.timezone("Asia/Almaty"))
+    global log_listener
+
+    from rich.logging import RichHandler
+
+    today = datetime.now(ZoneInfo("Asia/Almaty"))
 
     rich_logger = RichHandler(level="INFO", rich_tracebacks=True)
 
     log_folder = os.path.join(project_root, "logs")
-    os.makedirs(log_folder, exist_ok=True)
 
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)
 
-    log_format = (
-        "%(asctime).19s %(levelname)s %(name)s %(filename)s %(funcName)s : %(message)s"
-    )
-    formatter = logging.Formatter(log_format)
-
     today_str = today.strftime("%d.%m.%y")
     year_month_folder = os.path.join(log_folder, today.strftime("%Y/%B"))
-    os.makedirs(year_month_folder, exist_ok=True)
 
     logger_file = os.path.join(year_month_folder, f"{today_str}.log")
 
-    file_handler = logging.FileHandler(logger_file, encoding="utf-8")
+    file_handler = BufferedFileHandler(logger_file, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
+
+    buffered_file_handler = PeriodicMemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+    atexit.register(buffered_file_handler.close)
 
     httpcore_logger = logging.getLogger("httpcore")
     httpcore_logger.setLevel(logging.INFO)
@@ -51,8 +172,14 @@ def setup_logger(project_root: str) -> str:
     google_logger = logging.getLogger("google")
     google_logger.setLevel(logging.INFO)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(rich_logger)
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    log_listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, rich_logger, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    logger.addHandler(RecordQueueHandler(log_queue))
 
     return logger_file
 
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class TokenCache:
+    def __init__(self, path: str, expiry_margin: float = 300.0) -> None:
+        self.path = path
+        self.expiry_margin = expiry_margin
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(base_url: str, client_id: str, client_secret: str) -> str:
+        raw = "\n".join((base_url, client_id, client_secret))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._read().get(key)
+
+        if entry is None or entry["expires_at"] - self.expiry_margin <= time.time():
+            return None
+        return entry["token"]
+
+    def set(self, key: str, token: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            entries = {
+                k: v for k, v in self._read().items() if v["expires_at"] > time.time()
+            }
+            entries[key] = {"token": token, "expires_at": expires_at}
+            self._write(entries)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        cache_dir = os.path.dirname(self.path) or "."
+        os.makedirs(cache_dir, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
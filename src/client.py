@@ -0,0 +1,117 @@
+from typing import Any, Dict, Optional
+
+import requests
+from office365.runtime.auth.authentication_context import AuthenticationContext
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.odata.request import ODataRequest
+from office365.runtime.odata.v3.batch_request import ODataBatchV3Request
+from office365.runtime.odata.v3.json_light_format import JsonLightFormat
+from office365.runtime.odata.v3.metadata_level import ODataV3MetadataLevel
+from office365.sharepoint.client_context import ClientContext
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(pool_size: int = 32, retries: int = 3) -> requests.Session:
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.2,
+        status_forcelist=(429, 503),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class NoMetadataJsonLightFormat(JsonLightFormat):
+    def __init__(self) -> None:
+        super().__init__(ODataV3MetadataLevel.NoMetadata)
+
+    @property
+    def collection_next(self) -> str:
+        return "odata.nextLink"
+
+
+class SessionRequestMixin:
+    session: requests.Session
+
+    def execute_request_direct(self, request: RequestOptions) -> requests.Response:
+        self.beforeExecute.notify(request)  # type: ignore[attr-defined]
+
+        kwargs: Dict[str, Any] = {}
+        if request.method == HttpMethod.Put or request.is_bytes or request.is_file:
+            kwargs["data"] = request.data
+        elif request.method in (HttpMethod.Post, HttpMethod.Patch):
+            kwargs["json"] = request.data
+
+        return self.session.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            auth=request.auth,
+            verify=request.verify,
+            stream=request.stream,
+            proxies=request.proxies,
+            **kwargs,
+        )
+
+
+class SessionODataRequest(SessionRequestMixin, ODataRequest):
+    def __init__(self, json_format: JsonLightFormat, session: requests.Session) -> None:
+        super().__init__(json_format)
+        self.session = session
+
+
+class SessionODataBatchV3Request(SessionRequestMixin, ODataBatchV3Request):
+    def __init__(self, json_format: JsonLightFormat, session: requests.Session) -> None:
+        super().__init__(json_format)
+        self.session = session
+
+
+class SessionClientContext(ClientContext):
+    _pending_request: Optional[ODataRequest]
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_context: Optional[AuthenticationContext] = None,
+        session: Optional[requests.Session] = None,
+        no_metadata: bool = False,
+    ) -> None:
+        super().__init__(base_url, auth_context=auth_context)
+        self.session = session or create_session()
+        self.no_metadata = no_metadata
+
+    def _json_format(self) -> JsonLightFormat:
+        if self.no_metadata:
+            return NoMetadataJsonLightFormat()
+        return JsonLightFormat()
+
+    def pending_request(self) -> ODataRequest:
+        if self._pending_request is None:
+            self._pending_request = SessionODataRequest(
+                self._json_format(), self.session
+            )
+            self._pending_request.beforeExecute += self._authenticate_request
+            self._pending_request.beforeExecute += self._build_modification_query
+        return self._pending_request
+
+    def execute_batch(
+        self, items_per_batch: int = 100, success_callback: Any = None
+    ) -> "SessionClientContext":
+        batch_request = SessionODataBatchV3Request(self._json_format(), self.session)
+        batch_request.beforeExecute += self._authenticate_request
+        batch_request.beforeExecute += self._ensure_form_digest
+        while self.has_pending_request:
+            qry = self._get_next_query(items_per_batch)
+            batch_request.execute_query(qry)
+            if callable(success_callback):
+                success_callback(items_per_batch)
+        return self
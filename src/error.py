@@ -2,7 +2,8 @@ import json
 import logging
 
 from functools import wraps
-from typing import Any, Callable, List, TypeVar, cast, TypedDict
+from typing import (Any, Callable, Dict, List, Optional, Tuple, TypedDict,
+                    TypeVar, cast)
 
 from office365.runtime.client_request_exception import ClientRequestException
 from office365.sharepoint.lists.template_type import ListTemplateType
@@ -11,6 +12,12 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=Callable[..., Any])
 
+_AVAILABLE_TEMPLATES = tuple(
+    template_type
+    for template_type in vars(ListTemplateType)
+    if not (template_type.startswith("__") and template_type.endswith("__"))
+)
+
 
 class ErrorDetails(TypedDict):
     code: str
@@ -34,7 +41,9 @@ class SPException(Exception):
         self.error_details = error_details
         self.class_name = self.__class__.__name__
         self.error_message = self.format_error_message(message)
-        logger.error(self.error_message)
+        logger.error(
+            "%s - %s Error details: %s", self.class_name, message, self.error_details
+        )
         super().__init__(self.error_message)
 
     def format_error_message(self, message: str) -> str:
@@ -68,7 +77,7 @@ class InvalidClientIDError(Exception):
     def __init__(self, error_details: AuthErrorDetails) -> None:
         self.error_details = error_details
         self.error_message = f"Unknown client ID. {self.error_details}"
-        logger.error(self.error_message)
+        logger.error("Unknown client ID. %s", self.error_details)
         super().__init__(self.error_message)
 
 
@@ -76,7 +85,7 @@ class InvalidClientSecretError(Exception):
     def __init__(self, error_details: AuthErrorDetails) -> None:
         self.error_details = error_details
         self.error_message = f"Unknown client secret. {self.error_details}"
-        logger.error(self.error_message)
+        logger.error("Unknown client secret. %s", self.error_details)
         super().__init__(self.error_message)
 
 
@@ -97,7 +106,9 @@ class WrongDownloadOptionError(Exception):
         self.error_message = (
             f"Invalid download option - {self.option}. " f"Choose from: {self.options}"
         )
-        logger.error(self.error_message)
+        logger.error(
+            "Invalid download option - %s. Choose from: %s", self.option, self.options
+        )
         super().__init__(self.error_message)
 
 
@@ -118,69 +129,111 @@ class FormatNotSupportedError(Exception):
 class ListTemplateNotFoundError(Exception):
     def __init__(self, template_name: str) -> None:
         self.template_name = template_name
-        self.available_template_types = [
-            template_type
-            for template_type in ListTemplateType.__dict__
-            if not (template_type.startswith("__") and template_type.endswith("__"))
-        ]
+        self.available_template_types = _AVAILABLE_TEMPLATES
         self.error_message = (
             f"List template '{template_name}' not found. "
             f"Choose from: {self.available_template_types}"
         )
-        logger.error(self.error_message)
+        logger.error(
+            "List template '%s' not found. Choose from: %s",
+            template_name,
+            self.available_template_types,
+        )
         super().__init__(self.error_message)
 
 
+_CLIENT_REQUEST_ERRORS: Dict[
+    Tuple[str, Optional[str]], Callable[[ErrorDetails], SPException]
+] = {
+    ("System.IO.FileNotFoundException", None): SPFolderNotFoundError,
+    ("Microsoft.SharePoint.SPException", "-2130575338"): SPFileNotFoundError,
+    ("Microsoft.SharePoint.SPException", "-2130575257"): SPFileAlreadyExistsError,
+    ("System.ArgumentException", "-1"): SPListNotFoundError,
+}
+
+
+def _client_request_error(
+    exc: ClientRequestException,
+) -> Tuple[Optional[str], Optional[str]]:
+    # Verbose responses wrap the error in "error", nometadata ones in
+    # "odata.error"; ClientRequestException only knows about the former.
+    payload = exc.payload
+    if payload is None:
+        try:
+            payload = exc.response.json()
+        except ValueError:
+            return None, None
+    if not isinstance(payload, dict):
+        return None, None
+
+    error = payload.get("error") or payload.get("odata.error")
+    if not isinstance(error, dict):
+        return None, None
+
+    message = error.get("message")
+    if isinstance(message, dict):
+        message = message.get("value")
+    return error.get("code"), message
+
+
 def handle_client_request_error(exc: ClientRequestException) -> Exception:
-    args = exc.args
-    _, message, exc_details = args
-    code, exc_name = str(exc.code).split(", ")
-
-    error_details = ErrorDetails(
-        code=code,
-        exception_name=exc_name,
-        message=message,
-        exception_details=exc_details,
-    )
-
-    if exc_name == "System.IO.FileNotFoundException":
-        return SPFolderNotFoundError(error_details)
-    elif exc_name == "Microsoft.SharePoint.SPException" and code == "-2130575338":
-        return SPFileNotFoundError(error_details)
-    elif exc_name == "Microsoft.SharePoint.SPException" and code == "-2130575257":
-        return SPFileAlreadyExistsError(error_details)
-    elif exc_name == "System.ArgumentException" and code == "-1":
-        return SPListNotFoundError(error_details)
-    else:
+    full_code, message = _client_request_error(exc)
+    if not isinstance(full_code, str):
         return exc
+    exc_details = exc.args[2] if len(exc.args) > 2 else ""
+
+    sep = full_code.find(", ")
+    if sep == -1:
+        return exc
+    code = full_code[:sep]
+    exc_name = full_code[sep + 2 :]
+
+    error_class = _CLIENT_REQUEST_ERRORS.get(
+        (exc_name, code)
+    ) or _CLIENT_REQUEST_ERRORS.get((exc_name, None))
+    if error_class is None:
+        return exc
+
+    error_details: ErrorDetails = {
+        "code": code,
+        "exception_name": exc_name,
+        "message": message or "",
+        "exception_details": exc_details,
+    }
+    return error_class(error_details)
 
 
 def handle_value_error(exc: ValueError) -> Exception:
-    try:
-        error_details = json.loads(exc.args[0])
-        if error_details["error"] == "unauthorized_client":
-            return InvalidClientIDError(AuthErrorDetails(**error_details))
-        elif error_details["error"] == "invalid_client":
-            return InvalidClientSecretError(AuthErrorDetails(**error_details))
-        else:
-            return exc
-    except json.decoder.JSONDecodeError:
-        exc_message = exc.args[0]
+    exc_message = exc.args[0] if exc.args else ""
+    if not isinstance(exc_message, str):
+        return exc
+
+    if exc_message[:1] != "{":
         if exc_message == "Acquire app-only access token failed.":
             return InvalidSiteUrlError()
         return exc
 
+    try:
+        error_details = json.loads(exc_message)
+    except json.decoder.JSONDecodeError:
+        return exc
+
+    if error_details.get("error") == "unauthorized_client":
+        return InvalidClientIDError(AuthErrorDetails(**error_details))
+    elif error_details.get("error") == "invalid_client":
+        return InvalidClientSecretError(AuthErrorDetails(**error_details))
+    else:
+        return exc
+
 
 def handle_sharepoint_error(func: T) -> T:
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         try:
             return func(*args, **kwargs)
-        except ClientRequestException as exc:
-            raise handle_client_request_error(exc)
-        except ValueError as exc:
+        except (ClientRequestException, ValueError) as exc:
+            if isinstance(exc, ClientRequestException):
+                raise handle_client_request_error(exc)
             raise handle_value_error(exc)
-        except Exception as exc:
-            raise exc
 
     return cast(T, wrapper)
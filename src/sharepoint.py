@@ -1,12 +1,27 @@
+import hashlib
+import io
 import logging
+import math
 import os
-import pathlib
+import posixpath
 import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                as_completed, wait)
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import (IO, Any, Callable, Dict, FrozenSet, Iterator, List,
+                    Optional, Set, Tuple, Union)
+
+import requests
 
 from office365.runtime.auth.authentication_context import AuthenticationContext
-from office365.runtime.auth.client_credential import ClientCredential
+from office365.runtime.auth.providers.acs_token_provider import ACSTokenProvider
+from office365.runtime.auth.token_response import TokenResponse
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.http.request_options import RequestOptions
 from office365.sharepoint.client_context import ClientContext
 from office365.sharepoint.files.collection import FileCollection
 from office365.sharepoint.files.file import File
@@ -18,12 +33,24 @@ from office365.sharepoint.lists.list import List as SPList
 from office365.sharepoint.lists.template_type import \
     ListTemplateType as _ListTemplateType
 
+from src.cache import TokenCache, TTLCache
+from src.client import SessionClientContext, create_session
 from src.error import (FormatNotSupportedError, ListTemplateNotFoundError,
-                       UnspecifiedError, handle_sharepoint_error)
+                       handle_sharepoint_error)
 from src.tree import FileNode, FolderNode, FolderNodeDict, Tree
 
 logger = logging.getLogger(__name__)
 
+_MIN_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+_MAX_UPLOAD_CHUNK_SIZE = 250 * 1024 * 1024
+_DEFAULT_UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+_MIN_DOWNLOAD_PART_SIZE = 4 * 1024 * 1024
+_DEFAULT_BANDWIDTH_BYTES = 50 * 1000 * 1000 // 8
+_UPLOAD_CHUNK_RTT_FACTOR = 10
+
+_FOLDER_EXPAND_OPTIONS = ("Files", "Folders")
+_DATETIME_FIELDS = frozenset({"TimeCreated", "TimeLastModified"})
+
 
 class ListTemplateType(_ListTemplateType):
     def __init__(self) -> None:
@@ -31,19 +58,39 @@ class ListTemplateType(_ListTemplateType):
 
     @classmethod
     def get(cls, name: str) -> Optional[int]:
-        try:
-            return getattr(cls, name)
-        except AttributeError:
-            return None
+        return _TEMPLATE_MAP.get(name)
+
+
+_TEMPLATE_MAP: Dict[str, int] = {
+    name: value
+    for name, value in vars(_ListTemplateType).items()
+    if isinstance(value, int) and not name.startswith("__")
+}
 
 
 class SharePoint:
-    def __init__(self, base_url: str, client_id: str, client_secret: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        client_id: str,
+        client_secret: str,
+        max_workers: int = 8,
+        no_metadata: bool = False,
+        token_cache_path: Optional[str] = None,
+    ) -> None:
         self.base_url = base_url
         self.client_id = client_id
         self.client_secret = client_secret
+        self.max_workers = max_workers
+        self.no_metadata = no_metadata
+        self.batch_size = 100
 
         self._ctx: Optional[ClientContext] = None
+        self._local = threading.local()
+        self._session = create_session(pool_size=max(16, max_workers))
+        self._cache = TTLCache(maxsize=1024, ttl=30)
+        self._token_cache = TokenCache(token_cache_path) if token_cache_path else None
+        self._upload_chunk_size: Optional[int] = None
         self.is_connected = False
 
     @property
@@ -55,12 +102,21 @@ class SharePoint:
 
     @handle_sharepoint_error
     def _connect(self) -> None:
-        credentials = ClientCredential(self.client_id, self.client_secret)
-        self._ctx = ClientContext(
-            base_url=self.base_url, auth_context=AuthenticationContext(self.base_url)
-        ).with_credentials(credentials)
+        token, is_cached = self._get_token()
+
+        auth_context = AuthenticationContext(self.base_url)
+        auth_context.with_access_token(lambda: token)
+        self._ctx = SessionClientContext(
+            base_url=self.base_url,
+            auth_context=auth_context,
+            session=self._session,
+            no_metadata=self.no_metadata,
+        )
 
-        assert self._ctx is not None
+        if is_cached:
+            self.is_connected = True
+            logger.info("Connected to SharePoint site with cached token")
+            return
 
         self._ctx.load(self._ctx.web)
         self._ctx.execute_query()
@@ -69,57 +125,195 @@ class SharePoint:
             "Connected to SharePoint site: '%s'", self._ctx.web.properties["Title"]
         )
 
+    def _get_token(self) -> Tuple[TokenResponse, bool]:
+        cache_key = TokenCache.key(self.base_url, self.client_id, self.client_secret)
+        if self._token_cache is not None:
+            cached_token = self._token_cache.get(cache_key)
+            if cached_token is not None:
+                return TokenResponse(**cached_token), True
+
+        provider = ACSTokenProvider(self.base_url, self.client_id, self.client_secret)
+        token = provider.get_app_only_access_token()
+
+        if self._token_cache is not None:
+            self._token_cache.set(
+                cache_key,
+                {"access_token": token.accessToken, "token_type": token.tokenType},
+                self._token_expires_at(token),
+            )
+
+        return token, False
+
+    @staticmethod
+    def _token_expires_at(token: TokenResponse) -> float:
+        expires_on = getattr(token, "expiresOn", None)
+        if expires_on is not None:
+            return float(expires_on)
+        return time.time() + float(getattr(token, "expiresIn", 0))
+
+    def _get_upload_chunk_size(self) -> int:
+        if self._upload_chunk_size is None:
+            rtt = self._measure_rtt()
+            if rtt is None:
+                self._upload_chunk_size = _DEFAULT_UPLOAD_CHUNK_SIZE
+            else:
+                self._upload_chunk_size = self._upload_chunk_size_for(rtt)
+                logger.info(
+                    "RTT: %.3f s, upload chunk size: %d bytes",
+                    rtt,
+                    self._upload_chunk_size,
+                )
+        return self._upload_chunk_size
+
+    def _measure_rtt(self) -> Optional[float]:
+        start = time.perf_counter()
+        try:
+            self._session.head(self.base_url, timeout=5)
+        except requests.RequestException as e:
+            logger.warning("Failed to measure RTT: %s", e)
+            return None
+        return time.perf_counter() - start
+
+    @staticmethod
+    def _upload_chunk_size_for(rtt: float) -> int:
+        bdp = _DEFAULT_BANDWIDTH_BYTES * rtt
+        chunk_size = max(_MIN_UPLOAD_CHUNK_SIZE, int(bdp * _UPLOAD_CHUNK_RTT_FACTOR))
+        return min(chunk_size, _MAX_UPLOAD_CHUNK_SIZE)
+
+    def _worker_ctx(self) -> ClientContext:
+        ctx: Optional[ClientContext] = getattr(self._local, "ctx", None)
+        if ctx is None:
+            ctx = SessionClientContext(
+                base_url=self.base_url,
+                auth_context=self.ctx.authentication_context,
+                session=self._session,
+                no_metadata=self.no_metadata,
+            )
+            self._local.ctx = ctx
+        return ctx
+
     @handle_sharepoint_error
     def _folder(
-        self, folder_url: str, expand_options: Optional[List[str]] = None
+        self,
+        folder_url: str,
+        expand_options: Optional[List[str]] = None,
+        select_options: Optional[List[str]] = None,
     ) -> Folder:
         logger.info("Getting folder: '%s'", folder_url)
 
+        cache_key = (
+            "folder",
+            folder_url,
+            tuple(expand_options or ()),
+            tuple(select_options or ()),
+        )
+        cached_folder = self._cache.get(cache_key)
+        if cached_folder is None and not (expand_options or select_options):
+            # A folder expanded during traversal has every plain property too.
+            cached_folder = self._cache.get(
+                ("folder", folder_url, _FOLDER_EXPAND_OPTIONS, ())
+            )
+        if cached_folder is not None:
+            return cached_folder
+
         folder = self.ctx.web.get_folder_by_server_relative_url(folder_url)
+        if expand_options:
+            folder.expand(expand_options)
+        if select_options:
+            folder.select(select_options)
         self.ctx.load(folder)
         self.ctx.execute_query()
 
         if expand_options:
-            folder.expand(expand_options).get().execute_query()
+            self._load_remaining_pages(folder, expand_options)
 
         logger.info("Folder path: '%s'", folder.serverRelativeUrl)
 
+        self._cache.set(cache_key, folder)
+        return folder
+
+    @staticmethod
+    def _load_remaining_pages(folder: Folder, collection_names: List[str]) -> None:
+        for collection_name in collection_names:
+            collection = folder.get_property(collection_name)
+            if collection.has_next:
+                for _ in collection.paged(page_size=5000):
+                    pass
+
+    def _resolve_folder(self, folder: Union[str, Folder]) -> Folder:
+        if isinstance(folder, Folder):
+            return folder
+        return self._folder(folder)
+
+    @staticmethod
+    def _folder_url(folder: Union[str, Folder]) -> str:
+        if isinstance(folder, Folder):
+            return folder.properties.get(
+                "ServerRelativeUrl", str(folder.resource_path)
+            )
         return folder
 
     @handle_sharepoint_error
     def _file(self, file_url: str) -> File:
         logger.info("Getting file: '%s'", file_url)
 
+        cache_key = ("file", file_url)
+        cached_file = self._cache.get(cache_key)
+        if cached_file is not None:
+            return cached_file
+
         file = self.ctx.web.get_file_by_server_relative_url(file_url)
         self.ctx.load(file)
         self.ctx.execute_query()
 
         logger.info("File path: '%s'", file.serverRelativeUrl)
 
+        self._cache.set(cache_key, file)
         return file
 
+    @handle_sharepoint_error
+    def get_files_batch(self, file_urls: List[str]) -> List[File]:
+        logger.info("Getting %d files", len(file_urls))
+
+        files = []
+        for file_url in file_urls:
+            file = self.ctx.web.get_file_by_server_relative_url(file_url)
+            self.ctx.load(file)
+            files.append(file)
+        self.ctx.execute_batch(items_per_batch=self.batch_size)
+
+        for file_url, file in zip(file_urls, files):
+            self._cache.set(("file", file_url), file)
+
+        return files
+
     @handle_sharepoint_error
     def _list(self, list_name: str) -> SPList:
         logger.info("Getting list: '%s'", list_name)
 
+        cache_key = ("list", list_name)
+        cached_list = self._cache.get(cache_key)
+        if cached_list is not None:
+            return cached_list
+
         list_obj = self.ctx.web.lists.get_by_title(list_name)
         self.ctx.load(list_obj)
         self.ctx.execute_query()
 
+        self._cache.set(cache_key, list_obj)
         return list_obj
 
     @handle_sharepoint_error
     def _get_folder_contents(
-        self,
-        folder: Union[str, Folder],
-        recursive: bool = False,
-        tree: Optional[Tree] = None,
-        parent_node: Optional[FolderNode] = None,
+        self, folder: Union[str, Folder], recursive: bool = False
     ) -> Tree:
         if isinstance(folder, Folder):
-            folder_url = folder.properties["ServerRelativeUrl"]
+            root_folder = folder
         elif isinstance(folder, str):
             folder_url = folder.replace("\\", "/")
+            root_folder = self._folder(
+                folder_url, expand_options=list(_FOLDER_EXPAND_OPTIONS)
+            )
         else:
             raise TypeError(
                 (
@@ -128,43 +322,62 @@ class SharePoint:
                 )
             )
 
-        root_folder = (
-            self._folder(folder_url, expand_options=["Files", "Folders"])
-            if isinstance(folder, str)
-            else folder
-        )
+        tree = Tree(FolderNode(obj=root_folder))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: Set[Future[List[FolderNode]]] = set()
+            expanded = [tree.root]
+            while True:
+                subfolder_nodes: List[FolderNode] = []
+                for parent_node in expanded:
+                    for file in parent_node.obj.files:
+                        file_node = FileNode(obj=file, parent=parent_node)
+                        parent_node.add_child(file_node)
+                        self._cache.set(("file", file_node.path), file)
+
+                    if not recursive:
+                        continue
+
+                    for subfolder in parent_node.obj.folders:
+                        folder_node = FolderNode(obj=subfolder, parent=parent_node)
+                        parent_node.add_child(folder_node)
+                        subfolder_nodes.append(folder_node)
+
+                chunk_size = min(
+                    self.batch_size,
+                    max(1, math.ceil(len(subfolder_nodes) / self.max_workers)),
+                )
+                for i in range(0, len(subfolder_nodes), chunk_size):
+                    batch = subfolder_nodes[i : i + chunk_size]
+                    pending.add(executor.submit(self._expand_folders, batch))
 
-        if tree is None:
-            tree = Tree(FolderNode(obj=root_folder))
-            parent_node = tree.root
-        else:
-            new_folder_node = FolderNode(obj=root_folder, parent=parent_node)
-
-            assert parent_node is not None
-            parent_node.add_child(new_folder_node)
-            parent_node = new_folder_node
-
-        for file in root_folder.files:
-            file_node = FileNode(obj=file, parent=parent_node)
-            parent_node.add_child(file_node)
-
-        for subfolder in root_folder.folders:
-            if not recursive:
-                break
-
-            subfolder = subfolder.expand(["Files", "Folders"]).get().execute_query()
-            tree = self._get_folder_contents(
-                subfolder,
-                recursive=recursive,
-                tree=tree,
-                parent_node=parent_node,
-            )
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                expanded = [node for future in done for node in future.result()]
 
-        assert tree is not None, UnspecifiedError(
-            "Something went wrong while building the file tree..."
-        )
         return tree
 
+    @handle_sharepoint_error
+    def _expand_folders(self, folder_nodes: List[FolderNode]) -> List[FolderNode]:
+        ctx = self._worker_ctx()
+
+        folders = [
+            ctx.web.get_folder_by_id(node.obj.properties["UniqueId"])
+            .expand(list(_FOLDER_EXPAND_OPTIONS))
+            .get()
+            for node in folder_nodes
+        ]
+        ctx.execute_batch(items_per_batch=self.batch_size)
+
+        for node, folder in zip(folder_nodes, folders):
+            self._load_remaining_pages(folder, list(_FOLDER_EXPAND_OPTIONS))
+            node.obj = folder
+            self._cache.set(("folder", node.path, _FOLDER_EXPAND_OPTIONS, ()), folder)
+
+        return folder_nodes
+
     def list_folder_contents(
         self, folder_url: str, recursive: bool = False
     ) -> FolderNodeDict:
@@ -176,14 +389,16 @@ class SharePoint:
 
     def _format_contents(
         self,
-        collection: Union[FolderCollection, FileCollection],
+        collection: Union[FolderCollection, FileCollection, List[File]],
         include_properties: bool,
+        datetime_fields: FrozenSet[str] = frozenset(),
     ) -> List[Dict[str, Any]] | List[str]:
         contents = []
         for item in collection:
             if include_properties:
-                item = item.properties
-                for key, value in item.items():
+                item = dict(item.properties)
+                for key in datetime_fields & item.keys():
+                    value = item[key]
                     if isinstance(value, datetime):
                         item[key] = value.isoformat()
             else:
@@ -192,13 +407,32 @@ class SharePoint:
             contents.append(item)
         return contents
 
+    @staticmethod
+    def _select_options(
+        collection_name: str, include_properties: bool, fields: Optional[List[str]]
+    ) -> Optional[List[str]]:
+        if not include_properties:
+            fields = ["ServerRelativeUrl"]
+        elif not fields:
+            return None
+        return [f"{collection_name}/{field}" for field in fields]
+
     def list_subfolders(
-        self, folder_url: str, include_properties: bool = False
+        self,
+        folder_url: str,
+        include_properties: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]] | List[str]:
-        root_folder = self._folder(folder_url, expand_options=["Folders"])
+        root_folder = self._folder(
+            folder_url,
+            expand_options=["Folders"],
+            select_options=self._select_options("Folders", include_properties, fields),
+        )
 
         subfolders = self._format_contents(
-            root_folder.folders, include_properties=include_properties
+            root_folder.folders,
+            include_properties=include_properties,
+            datetime_fields=_DATETIME_FIELDS,
         )
 
         logger.info("Subfolders: %s", subfolders)
@@ -206,36 +440,127 @@ class SharePoint:
         return subfolders
 
     def list_files(
-        self, folder_url: str, include_properties: bool = False
+        self,
+        folder_url: str,
+        include_properties: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]] | List[str]:
-        root_folder = self._folder(folder_url, expand_options=["Files"])
+        root_folder = self._folder(
+            folder_url,
+            expand_options=["Files"],
+            select_options=self._select_options("Files", include_properties, fields),
+        )
 
         files = self._format_contents(
-            root_folder.files, include_properties=include_properties
+            root_folder.files,
+            include_properties=include_properties,
+            datetime_fields=_DATETIME_FIELDS,
         )
 
         logger.info("Files: %s", files)
 
         return files
 
+    @handle_sharepoint_error
+    def list_files_via_items(
+        self, list_name: str, include_properties: bool = False
+    ) -> List[Dict[str, Any]] | List[str]:
+        logger.info("Listing files of list: '%s'", list_name)
+
+        items = (
+            self.ctx.web.lists.get_by_title(list_name)
+            .items.filter("FSObjType eq 0")
+            .expand(["File"])
+            .get_all(page_size=5000)
+            .execute_query()
+        )
+
+        files = self._format_contents(
+            [item.file for item in items],
+            include_properties=include_properties,
+            datetime_fields=_DATETIME_FIELDS,
+        )
+
+        logger.info("Files: %d", len(files))
+
+        return files
+
     @handle_sharepoint_error
     def read_file(self, file_url: str) -> bytes:
         logger.info("Reading file: '%s'", file_url)
 
-        file = self._file(file_url)
-        response = file.get_content().execute_query()
-        file_content = response.value
+        file_content = self._read_file_content(file_url)
 
         logger.info("File type: %s", type(file_content))
         logger.info("File size: %s bytes", len(file_content))
 
-        if len(file_content) > 10:
-            logger.info("File content: %s...", file_content[:10])
-        else:
-            logger.info("File content: %s", file_content)
+        if logger.isEnabledFor(logging.INFO):
+            if len(file_content) > 10:
+                logger.info("File content: %s...", file_content[:10])
+            else:
+                logger.info("File content: %s", file_content)
 
         return file_content
 
+    @handle_sharepoint_error
+    def _open_file_stream(
+        self, file_url: str, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        ctx = self._worker_ctx()
+        file = ctx.web.get_file_by_server_relative_url(file_url)
+        request = RequestOptions(f"{file.resource_url}/$value")
+        request.stream = True
+        for name, value in (headers or {}).items():
+            request.set_header(name, value)
+
+        response = ctx.pending_request().execute_request_direct(request)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            exc = ClientRequestException(*e.args, response=e.response)
+            response.close()
+            raise exc
+        return response
+
+    def read_file_stream(
+        self, file_url: str, chunk_size: int = 1 << 20
+    ) -> Iterator[bytes]:
+        logger.info("Streaming file: '%s'", file_url)
+
+        response = self._open_file_stream(file_url)
+        return self._iter_response(response, chunk_size)
+
+    @staticmethod
+    def _iter_response(
+        response: requests.Response, chunk_size: int
+    ) -> Iterator[bytes]:
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def _stream_into(self, file_url: str, *sinks: Callable[[bytes], Any]) -> None:
+        for chunk in self.read_file_stream(file_url):
+            for sink in sinks:
+                sink(chunk)
+
+    def read_files(self, file_urls: List[str]) -> Dict[str, bytes]:
+        logger.info("Reading %d files", len(file_urls))
+
+        if not self.is_connected:
+            self._connect()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            file_contents = dict(
+                zip(file_urls, executor.map(self._read_file_content, file_urls))
+            )
+
+        logger.info(
+            "Files read: %d, total size: %d bytes",
+            len(file_contents),
+            sum(len(content) for content in file_contents.values()),
+        )
+
+        return file_contents
+
     def get_file_properties(self, file_url: str) -> Dict[str, Any]:
         logger.info("Getting file properties: '%s'", file_url)
 
@@ -247,15 +572,149 @@ class SharePoint:
         return file_properties
 
     @handle_sharepoint_error
-    def download_file(self, file_url: str, download_path: str) -> None:
+    def download_file(self, file_url: str, download_path: str) -> str:
         logger.info("Downloading file: '%s'", file_url)
 
-        file = self._file(file_url)
-        with open(download_path, "wb") as f:
-            file.download(f).execute_query()
+        response = self._open_file_stream(file_url)
+        digest = self._save_response(response, download_path)
 
         logger.info("File downloaded to: '%s'", download_path)
 
+        return digest
+
+    def _save_response(self, response: requests.Response, download_path: str) -> str:
+        sha256 = hashlib.sha256()
+        with response, open(download_path, "wb", buffering=1 << 20) as f:
+            try:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+                    sha256.update(chunk)
+            except BaseException:
+                f.close()
+                os.remove(download_path)
+                raise
+        return sha256.hexdigest()
+
+    def download_file_multipart(
+        self, file_url: str, download_path: str, parts: int = 8
+    ) -> str:
+        logger.info("Downloading file in %d parts: '%s'", parts, file_url)
+
+        file_size = int(self._file(file_url).properties["Length"])
+        part_size = max(_MIN_DOWNLOAD_PART_SIZE, math.ceil(file_size / parts))
+        if file_size <= part_size:
+            return self.download_file(file_url, download_path)
+
+        ranges = [
+            (start, min(start + part_size, file_size) - 1)
+            for start in range(0, file_size, part_size)
+        ]
+        first_start, first_end = ranges[0]
+        first_response = self._open_file_stream(
+            file_url, headers={"Range": f"bytes={first_start}-{first_end}"}
+        )
+        if first_response.status_code != 206:
+            # The server ignored Range and is already sending the whole file.
+            logger.info("Ranges are not supported, downloading in one request")
+            digest = self._save_response(first_response, download_path)
+            logger.info("File downloaded to: '%s'", download_path)
+            return digest
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            with open(download_path, "wb") as f:
+                f.truncate(file_size)
+
+            futures = [
+                executor.submit(
+                    self._write_range,
+                    first_response,
+                    download_path,
+                    first_start,
+                    first_end,
+                )
+            ]
+            futures += [
+                executor.submit(
+                    self._download_range_concurrent, file_url, download_path, start, end
+                )
+                for start, end in ranges[1:]
+            ]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            first_response.close()
+            if os.path.exists(download_path):
+                os.remove(download_path)
+            raise
+        executor.shutdown()
+
+        sha256 = hashlib.sha256()
+        with open(download_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha256.update(chunk)
+
+        logger.info("File downloaded to: '%s'", download_path)
+
+        return sha256.hexdigest()
+
+    def _download_range_concurrent(
+        self, file_url: str, download_path: str, start: int, end: int
+    ) -> None:
+        response = self._open_file_stream(
+            file_url, headers={"Range": f"bytes={start}-{end}"}
+        )
+        self._write_range(response, download_path, start, end)
+
+    def _write_range(
+        self, response: requests.Response, download_path: str, start: int, end: int
+    ) -> None:
+        with response:
+            if response.status_code != 206:
+                raise requests.HTTPError(
+                    f"Expected a partial response for bytes {start}-{end}, "
+                    f"got {response.status_code}",
+                    response=response,
+                )
+
+            with open(download_path, "r+b", buffering=1 << 20) as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+
+    @handle_sharepoint_error
+    def _read_file_content(self, file_url: str) -> bytes:
+        buffer = io.BytesIO()
+        self._stream_into(file_url, buffer.write)
+        return buffer.getvalue()
+
+    def _spool_file_concurrent(self, file_url: str) -> IO[bytes]:
+        spooled_file = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+        try:
+            self._stream_into(file_url, spooled_file.write)
+        except BaseException:
+            spooled_file.close()
+            raise
+        spooled_file.seek(0)
+        return spooled_file  # type: ignore[return-value]
+
+    def download_files(self, files: List[Tuple[str, str]]) -> None:
+        logger.info("Downloading %d files", len(files))
+
+        if not self.is_connected:
+            self._connect()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.download_file, file_url, download_path)
+                for file_url, download_path in files
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        logger.info("Files downloaded: %d", len(files))
+
     def download_folder(
         self,
         folder_url: str,
@@ -269,47 +728,64 @@ class SharePoint:
 
         logger.info("Downloading folder: '%s'", folder_url)
 
-        base_name = output_zip_file.replace(".zip", "")
-        os.makedirs(base_name, exist_ok=True)
-        logger.info("Downloading to folder: '%s'", base_name)
-
-        temp_dir = pathlib.Path(os.path.basename(base_name), "temp").as_posix()
-        os.makedirs(temp_dir, exist_ok=True)
-        logger.info("Temporary folder created: '%s'", temp_dir)
-
         tree = self._get_folder_contents(folder_url, recursive=recursive)
+        files = {node.path: node.rel_path for node in tree.iter_files()}
 
-        for node in tree:
-            rel_path = node.path if not node.path.startswith("/") else node.path[1:]
-
-            if node.is_file():
-                download_path = pathlib.Path(temp_dir, rel_path).as_posix()
-                download_folder = os.path.dirname(download_path)
-                os.makedirs(download_folder, exist_ok=True)
-                self.download_file(node.path, download_path)
-
-        base_name = output_zip_file.replace(".zip", "")
-        shutil.make_archive(base_name, "zip", temp_dir)
-        shutil.rmtree(temp_dir)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures: Dict[Future[IO[bytes]], str] = {}
+        try:
+            with zipfile.ZipFile(
+                output_zip_file, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+            ) as zf:
+                for file_url, arcname in files.items():
+                    future = executor.submit(self._spool_file_concurrent, file_url)
+                    futures[future] = arcname
+
+                for future in as_completed(futures):
+                    with future.result() as spooled_file, zf.open(
+                        futures[future], "w", force_zip64=True
+                    ) as zipped_file:
+                        for chunk in iter(lambda: spooled_file.read(1 << 20), b""):
+                            zipped_file.write(chunk)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().close()
+            if os.path.exists(output_zip_file):
+                os.remove(output_zip_file)
+            raise
+        executor.shutdown()
+
+        logger.info("Folder downloaded to: '%s'", output_zip_file)
 
     @handle_sharepoint_error
-    def _create_folder(self, parent_folder_url: str, folder_name: str) -> Folder:
+    def _create_folder(
+        self, parent_folder: Union[str, Folder], folder_name: str
+    ) -> Folder:
         if folder_name.startswith("/") or folder_name.startswith("\\"):
             raise ValueError(
                 "Folder name should not start with '/' or '\\'. "
                 "Use only the folder name without the path."
             )
 
-        logger.info("Creating folder: '%s' under '%s'", folder_name, parent_folder_url)
+        logger.info(
+            "Creating folder: '%s' under '%s'",
+            folder_name,
+            self._folder_url(parent_folder),
+        )
 
-        parent_folder = self._folder(parent_folder_url)
+        parent_folder = self._resolve_folder(parent_folder)
         new_folder = parent_folder.folders.add(folder_name)
-        self.ctx.execute_query()
+        parent_folder.context.execute_query()
+        self._cache.clear()
 
         return new_folder
 
-    def create_folder(self, parent_folder_url: str, folder_name: str) -> str:
-        new_folder = self._create_folder(parent_folder_url, folder_name)
+    def create_folder(
+        self, parent_folder: Union[str, Folder], folder_name: str
+    ) -> str:
+        new_folder = self._create_folder(parent_folder, folder_name)
         path = new_folder.properties["ServerRelativeUrl"]
         logger.info("Folder created: '%s'", path)
 
@@ -334,40 +810,45 @@ class SharePoint:
     @handle_sharepoint_error
     def upload_file(
         self,
-        remote_folder_url: str,
+        remote_folder: Union[str, Folder],
         local_file_path: str,
         overwrite: bool = False,
-        chunk_size_bytes: int = 10 * 1024 * 1024,
+        chunk_size_bytes: Optional[int] = None,
     ) -> str:
         total_bytes = os.path.getsize(local_file_path)
-        max_chunk_size_bytes = 250 * 1024 * 1024
-        if total_bytes > max_chunk_size_bytes and chunk_size_bytes is None:
-            raise ValueError(
-                "File size is greater than 250 MB. "
-                "Please specify a chunk size to upload the file."
-            )
-
-        if chunk_size_bytes > max_chunk_size_bytes:
+        if chunk_size_bytes is not None and chunk_size_bytes > _MAX_UPLOAD_CHUNK_SIZE:
             raise ValueError(
                 "Chunk size should be less than 262,144,000 bytes (250 MB)."
             )
 
-        logger.info("Uploading file: '%s' to '%s'", local_file_path, remote_folder_url)
+        logger.info(
+            "Uploading file: '%s' to '%s'",
+            local_file_path,
+            self._folder_url(remote_folder),
+        )
 
-        folder = self._folder(remote_folder_url)
+        folder = self._resolve_folder(remote_folder)
+        # An explicit chunk size keeps doubling as the single-request limit;
+        # otherwise files up to the default size go in one request and only
+        # larger ones pay for the RTT probe.
+        single_upload_limit = chunk_size_bytes or _DEFAULT_UPLOAD_CHUNK_SIZE
 
-        if total_bytes <= chunk_size_bytes:
+        if total_bytes <= single_upload_limit:
             with open(local_file_path, "rb") as f:
                 file = folder.files.add(os.path.basename(local_file_path), f, overwrite)
-                self.ctx.execute_query()
+                folder.context.execute_query()
         else:
+            if chunk_size_bytes is None:
+                chunk_size_bytes = self._get_upload_chunk_size()
             file = folder.files.create_upload_session(
                 local_file_path,
                 chunk_size=chunk_size_bytes,
                 chunk_uploaded=self._chunk_uploaded,
                 total_bytes=total_bytes,
             )
-            self.ctx.execute_query()
+            folder.context.execute_query()
+
+        self._cache.clear()
 
         path = file.properties["ServerRelativeUrl"]
         logger.info("File uploaded: '%s'", path)
@@ -380,50 +861,70 @@ class SharePoint:
 
         file = self._file(file_url)
         file.delete_object().execute_query()
+        self._cache.clear()
 
         logger.info("File deleted")
 
     @handle_sharepoint_error
-    def delete_folder(self, folder_url: str, recursive: bool = False) -> None:
-        logger.info("Deleting folder: '%s'", folder_url)
+    def delete_folder(
+        self, folder: Union[str, Folder], recursive: bool = False
+    ) -> None:
+        logger.info("Deleting folder: '%s'", self._folder_url(folder))
 
-        folder = self._folder(folder_url)
+        folder = self._resolve_folder(folder)
         folder.delete_object().execute_query()
+        self._cache.clear()
 
         logger.info("Folder deleted")
 
+    def _upload_file_concurrent(
+        self, remote_folder_url: str, local_file_path: str, overwrite: bool
+    ) -> str:
+        folder = self._worker_ctx().web.get_folder_by_server_relative_url(
+            remote_folder_url
+        )
+        return self.upload_file(folder, local_file_path, overwrite)
+
     @handle_sharepoint_error
-    def upload_folder(self, remote_folder_url: str, local_folder: str) -> Any:
+    def upload_folder(
+        self, remote_folder_url: str, local_folder: str, overwrite: bool = False
+    ) -> str:
         logger.info("Uploading folder: '%s' to '%s'", local_folder, remote_folder_url)
 
-        print()
+        local_folder = os.path.normpath(local_folder)
+        root_url = posixpath.join(remote_folder_url, os.path.basename(local_folder))
 
-        root = remote_folder_url
-        current_folder_url = root
+        folder_urls_by_depth: Dict[int, List[str]] = {}
+        files: List[Tuple[str, str]] = []
+        for dirpath, _, filenames in os.walk(local_folder):
+            rel_dir = os.path.relpath(dirpath, local_folder)
+            parts = [] if rel_dir == os.curdir else rel_dir.split(os.sep)
+            folder_url = posixpath.join(root_url, *parts)
 
-        print(root)
-        print(local_folder)
+            folder_urls_by_depth.setdefault(len(parts), []).append(folder_url)
+            files.extend(
+                (folder_url, os.path.join(dirpath, filename)) for filename in filenames
+            )
 
-        for dirpath, _, filenames in os.walk(local_folder):
-            print(dirpath)
-            # folder_name = os.path.basename(dirpath)
-            # current_folder_url = pathlib.Path(
-            #     current_folder_url, folder_name
-            # ).as_posix()
-            #
-            # parent_folder_url = os.path.relpath(remote_folder_url, dirpath)
-            #
-            # logger.info("parent_folder_url: %s", parent_folder_url)
-            # logger.info("folder_name: %s", folder_name)
-            # self.create_folder(root, folder_name)
-
-            for filename in filenames:
-                print()
-            print("\n")
-
-        # logger.info("Folder uploaded")
-
-        # return remote_folder_url
+        for depth in sorted(folder_urls_by_depth):
+            for folder_url in folder_urls_by_depth[depth]:
+                self.ctx.web.folders.add(folder_url)
+            self.ctx.execute_batch(items_per_batch=self.batch_size)
+        self._cache.clear()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._upload_file_concurrent, folder_url, local_file_path, overwrite
+                )
+                for folder_url, local_file_path in files
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        logger.info("Folder uploaded: '%s'", root_url)
+
+        return root_url
 
     def upload_folder_as_zip(
         self, remote_folder_url: str, local_folder_path: str
@@ -448,6 +949,7 @@ class SharePoint:
 
         create_info = ListCreationInformation(list_name, None, ListTemplateType.Tasks)
         list_object = self.ctx.web.lists.add(create_info).execute_query()
+        self._cache.clear()
         list_title = list_object.properties["Title"]
         logger.info("List created: '%s'", list_title)
 
@@ -461,6 +963,7 @@ class SharePoint:
 
         list_object.set_property("Title", new_list_name)
         list_object.update().execute_query()
+        self._cache.clear()
 
         logger.info("List updated: '%s'", new_list_name)
 
@@ -1,4 +1,4 @@
-from typing import List, Optional, TypedDict, Union, Generator
+from typing import Generator, Iterator, List, Optional, Tuple, TypedDict, Union
 
 from office365.sharepoint.files.file import File
 from office365.sharepoint.folders.folder import Folder
@@ -22,6 +22,8 @@ class FileNodeDict(TypedDict):
 
 
 class Node:
+    __slots__ = ("obj", "name", "path", "rel_path", "type", "parent")
+
     def __init__(
         self,
         obj: Union[File, Folder],
@@ -31,6 +33,7 @@ class Node:
         self.obj = obj
         self.name = obj.properties["Name"]
         self.path = obj.properties["ServerRelativeUrl"]
+        self.rel_path = self.path.lstrip("/")
         self.type = type
         self.parent = parent
 
@@ -52,6 +55,8 @@ class Node:
 
 
 class FolderNode(Node):
+    __slots__ = ("children",)
+
     def __init__(
         self,
         obj: Folder,
@@ -68,15 +73,30 @@ class FolderNode(Node):
     def to_dict(
         self,
     ) -> FolderNodeDict:
-        return FolderNodeDict(
-            name=self.name,
-            path=self.path,
-            type=self.type,
-            children=[child.to_dict() for child in self.children],
+        root_dict = FolderNodeDict(
+            name=self.name, path=self.path, type=self.type, children=[]
         )
+        stack: List[Tuple[ChildNode, FolderNodeDict]] = [
+            (child, root_dict) for child in reversed(self.children)
+        ]
+        while stack:
+            node, parent_dict = stack.pop()
+
+            if isinstance(node, FolderNode):
+                folder_dict = FolderNodeDict(
+                    name=node.name, path=node.path, type=node.type, children=[]
+                )
+                parent_dict["children"].append(folder_dict)
+                stack.extend((child, folder_dict) for child in reversed(node.children))
+            else:
+                parent_dict["children"].append(node.to_dict())
+
+        return root_dict
 
 
 class FileNode(Node):
+    __slots__ = ()
+
     def __init__(self, obj: File, parent: FolderNode) -> None:
         super().__init__(obj=obj, type="file", parent=parent)
 
@@ -85,9 +105,12 @@ class FileNode(Node):
 
 
 class Tree:
+    __slots__ = ("root", "_depth", "_length")
+
     def __init__(self, root: FolderNode) -> None:
         self.root = root
         self._depth = 0
+        self._length = 0
 
     @property
     def depth(self) -> int:
@@ -108,15 +131,32 @@ class Tree:
         return self.root.to_dict()
 
     def __iter__(self) -> Generator[ChildNode, None, None]:
-        stack: List[ChildNode] = [self.root]
+        yield self.root
+        stack: List[Iterator[ChildNode]] = [iter(self.root.children)]
         while stack:
-            node = stack.pop()
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                continue
             yield node
             if isinstance(node, FolderNode):
-                stack.extend(reversed(node.children))
+                stack.append(iter(node.children))
+
+    def iter_files(self) -> Generator[FileNode, None, None]:
+        stack: List[Iterator[ChildNode]] = [iter(self.root.children)]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+            elif isinstance(node, FolderNode):
+                stack.append(iter(node.children))
+            else:
+                yield node
 
     def __len__(self) -> int:
-        return sum(1 for _ in self)
+        if self._length == 0:
+            self._length = sum(1 for _ in self)
+        return self._length
 
     def __str__(self) -> str:
         return f"Tree(root={self.root} depth={self.depth})"
@@ -0,0 +1,101 @@
+import functools
+import os
+from typing import Any, Iterator, List, Optional, Tuple, cast
+
+import dotenv
+import pytest
+import requests
+import responses
+
+from tests.fake_sharepoint import BASE_URL, CLIENT_ID, CLIENT_SECRET, FakeSharePoint
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Run the tests against the SharePoint site configured in .env",
+    )
+
+
+@pytest.fixture(scope="session")
+def live(request: pytest.FixtureRequest) -> bool:
+    return cast(bool, request.config.getoption("--live"))
+
+
+@functools.cache
+def _creds() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    dotenv.load_dotenv()
+    return os.getenv("BASE_URL"), os.getenv("CLIENT_ID"), os.getenv("CLIENT_SECRET")
+
+
+@pytest.fixture(scope="session")
+def creds(live: bool) -> Tuple[str, str, str]:
+    if not live:
+        return BASE_URL, CLIENT_ID, CLIENT_SECRET
+
+    base_url, client_id, client_secret = _creds()
+    if not (base_url and client_id and client_secret):
+        pytest.skip("SharePoint credentials are not set")
+    return base_url, client_id, client_secret
+
+
+def _seed(fake: FakeSharePoint) -> None:
+    fake.lists["TestList"] = "/Lists/TestList"
+    fake.add_file(
+        "/Shared Documents/Rekvizity (1).docx", bytes(range(256)) * (9 * 4096)
+    )
+    fake.add_file("/Shared Documents/Test_03-05-2024/report.xlsx", b"report" * 1024)
+    fake.add_file("/Shared Documents/Test_03-05-2024/notes.txt", b"notes")
+    fake.add_file("/Shared Documents/Test_03-05-2024/Archive/2023.txt", b"2023")
+    fake.add_file("/Shared Documents/Test_03-05-2024/Archive/Old/2022.txt", b"2022")
+    fake.add_folder("/Shared Documents/Test_03-05-2024/Empty")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fake_sharepoint(live: bool) -> Iterator[Optional[FakeSharePoint]]:
+    if live:
+        yield None
+        return
+
+    fake = FakeSharePoint()
+    _seed(fake)
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        fake.register(mock)
+        yield fake
+
+
+@pytest.fixture
+def sent_requests(monkeypatch: pytest.MonkeyPatch) -> List[requests.PreparedRequest]:
+    sent: List[requests.PreparedRequest] = []
+    send = requests.Session.send
+
+    def _send(
+        self: requests.Session, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        sent.append(request)
+        return send(self, request, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "send", _send)
+    return sent
+
+
+@pytest.fixture
+def mocked_acs() -> Iterator[FakeSharePoint]:
+    # Stays mocked under --live, so the failed-auth tests never hit ACS.
+    fake = FakeSharePoint()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        fake.register(mock)
+        yield fake
+
+
+@pytest.fixture
+def fake_site() -> Iterator[FakeSharePoint]:
+    # A fresh, always mocked site for tests that modify it or tweak its
+    # behaviour, so the session-wide site stays untouched.
+    fake = FakeSharePoint()
+    _seed(fake)
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        fake.register(mock)
+        yield fake
@@ -0,0 +1,334 @@
+import json
+import re
+import uuid
+from email import message_from_bytes
+from email.message import Message
+from typing import Any, Dict, List, Optional, Tuple, cast
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import responses
+
+BASE_URL = "https://contoso.sharepoint.com"
+SITE_PATH = ""
+REALM = "11111111-1111-1111-1111-111111111111"
+CLIENT_ID = "22222222-2222-2222-2222-222222222222"
+CLIENT_SECRET = "secret"
+TOKEN_URL = f"https://accounts.accesscontrol.windows.net/{REALM}/tokens/OAuth/2"
+
+_Response = Tuple[int, Dict[str, str], Any]
+
+
+class FakeSharePoint:
+    def __init__(self) -> None:
+        self.folders: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.contents: Dict[str, bytes] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.page_size: Optional[int] = None
+        self.ranges = True
+        self.lists: Dict[str, str] = {"Documents": f"{SITE_PATH}/Shared Documents"}
+        self.client_id = CLIENT_ID
+        self.client_secret = CLIENT_SECRET
+        self.add_folder(f"{SITE_PATH}/Shared Documents")
+
+    def add_folder(self, url: str) -> None:
+        parent = url.rsplit("/", 1)[0]
+        if parent != SITE_PATH and parent not in self.folders:
+            self.add_folder(parent)
+        self.folders.setdefault(
+            url,
+            {
+                "Name": url.rsplit("/", 1)[1],
+                "ServerRelativeUrl": url,
+                "UniqueId": str(uuid.uuid4()),
+                "Exists": True,
+                "TimeCreated": "2024-05-03T10:00:00Z",
+                "TimeLastModified": "2024-05-03T10:00:00Z",
+            },
+        )
+
+    def add_file(self, url: str, content: bytes) -> None:
+        self.add_folder(url.rsplit("/", 1)[0])
+        self.files[url] = {
+            "Name": url.rsplit("/", 1)[1],
+            "ServerRelativeUrl": url,
+            "Length": str(len(content)),
+            "UniqueId": str(uuid.uuid4()),
+            "Exists": True,
+            "TimeCreated": "2024-05-03T10:00:00Z",
+            "TimeLastModified": "2024-05-03T10:00:00Z",
+        }
+        self.contents[url] = content
+
+    def children(self, url: str) -> Tuple[List[str], List[str]]:
+        folders = [u for u in self.folders if u.rsplit("/", 1)[0] == url]
+        files = [u for u in self.files if u.rsplit("/", 1)[0] == url]
+        return sorted(folders), sorted(files)
+
+    def register(self, mock: responses.RequestsMock) -> None:
+        mock.add_callback(responses.HEAD, BASE_URL, callback=self._realm)
+        mock.add_callback(responses.POST, TOKEN_URL, callback=self._token)
+        for method in (responses.GET, responses.POST):
+            mock.add_callback(
+                method, re.compile(re.escape(BASE_URL) + "/_api/.*"), callback=self._api
+            )
+
+    def _realm(self, request: Any) -> _Response:
+        header = f'Bearer realm="{REALM}",client_id="00000003"'
+        return 401, {"WWW-Authenticate": header}, ""
+
+    def _token(self, request: Any) -> _Response:
+        form = {k: v[0] for k, v in parse_qs(request.body).items()}
+        if form.get("client_id") != f"{self.client_id}@{REALM}":
+            return self._auth_error(400, "unauthorized_client", "AADSTS700016")
+        if form.get("client_secret") != self.client_secret:
+            return self._auth_error(401, "invalid_client", "AADSTS7000215")
+        body = {"token_type": "Bearer", "access_token": "token", "expires_in": "3599"}
+        return 200, {"Content-Type": "application/json"}, json.dumps(body)
+
+    def _api(self, request: Any) -> _Response:
+        if request.url.endswith("/_api/$batch"):
+            self.requests.append((request.method, request.url))
+            return self._batch(request)
+        return self._dispatch(
+            request.method,
+            request.url,
+            request.headers.get("Accept", ""),
+            request.body,
+            request.headers.get("Range"),
+        )
+
+    def _dispatch(
+        self,
+        method: str,
+        url: str,
+        accept: str,
+        body: Any = None,
+        range_header: Optional[str] = None,
+    ) -> _Response:
+        self.requests.append((method, url))
+        verbose = "nometadata" not in accept
+        parts = urlsplit(url)
+        path = unquote(parts.path)[len(SITE_PATH) + len("/_api/") :]
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        expand = [e for e in query.get("$expand", "").split(",") if e]
+
+        if path.lower() == "contextinfo":
+            info = {"FormDigestValue": "digest", "FormDigestTimeoutSeconds": 1800}
+            return self._json({"GetContextWebInformation": info}, verbose)
+        if path == "Web":
+            return self._json({"Title": "Test site"}, verbose)
+
+        match = re.match(
+            r"Web/lists/GetByTitle\('(.*)'\)(/items)?$", path, re.IGNORECASE
+        )
+        if match:
+            library = self.lists.get(match.group(1))
+            if library is None:
+                return self._not_found("-1, System.ArgumentException", verbose)
+            if not match.group(2):
+                entity = {"Title": match.group(1), "RootFolder": library}
+                return self._json(entity, verbose)
+            files = sorted(u for u in self.files if u.startswith(library + "/"))
+            items = [{"FSObjType": 0, "File": dict(self.files[u])} for u in files]
+            skip = int(query.get("$skiptoken", "0"))
+            page = self._page(items, skip, url.split("?")[0], verbose)
+            return self._json(page, verbose)
+
+        match = re.match(r"Web/Folders/Add\('(.*)'\)$", path, re.IGNORECASE)
+        if match and method == "POST":
+            self.add_folder(match.group(1))
+            return self._json(dict(self.folders[match.group(1)]), verbose)
+
+        match = re.match(
+            r"Web/(getFileByServerRelativeUrl|GetFileById)\('(.*)'\)(/\$value)?$", path
+        )
+        if match:
+            file_url = match.group(2)
+            if match.group(1) == "GetFileById":
+                file_url = next(
+                    (u for u, f in self.files.items() if f["UniqueId"] == file_url), ""
+                )
+            if file_url not in self.files:
+                return self._not_found(
+                    "-2130575338, Microsoft.SharePoint.SPException", verbose
+                )
+            if match.group(3):
+                headers = {"Content-Type": "application/octet-stream"}
+                content = self.contents[file_url]
+                range_match = re.match(r"bytes=(\d+)-(\d+)", range_header or "")
+                if self.ranges and range_match:
+                    start, end = int(range_match.group(1)), int(range_match.group(2))
+                    return 206, headers, content[start : end + 1]
+                return 200, headers, content
+            return self._json(dict(self.files[file_url]), verbose)
+
+        match = re.match(
+            r"Web/(getFolderByServerRelativeUrl|GetFolderById)\('(.*?)'\)(/.*)?$",
+            path,
+        )
+        if match:
+            key = match.group(2)
+            if match.group(1) == "GetFolderById":
+                key = next(
+                    (u for u, f in self.folders.items() if f["UniqueId"] == key), ""
+                )
+            if key not in self.folders:
+                return self._not_found(
+                    "-2147024894, System.IO.FileNotFoundException", verbose
+                )
+            if method == "POST":
+                return self._add_to_folder(key, match.group(3) or "", body, verbose)
+
+            folders, files = self.children(key)
+            skip = int(query.get("$skiptoken", "0"))
+            collection_url = url.split("?")[0]
+            if match.group(3) == "/Files":
+                page = self._page(
+                    [self.files[u] for u in files], skip, collection_url, verbose
+                )
+                return self._json(page, verbose)
+            if match.group(3) == "/Folders":
+                page = self._page(
+                    [self.folders[u] for u in folders], skip, collection_url, verbose
+                )
+                return self._json(page, verbose)
+            select = [f for f in query.get("$select", "").split(",") if f]
+            entity = dict(self.folders[key])
+            if select:
+                entity = {k: v for k, v in entity.items() if k in select}
+            if "Files" in expand:
+                entity["Files"] = self._page(
+                    [self._select(self.files[u], select, "Files") for u in files],
+                    0,
+                    collection_url + "/Files",
+                    verbose,
+                )
+            if "Folders" in expand:
+                entity["Folders"] = self._page(
+                    [self._select(self.folders[u], select, "Folders") for u in folders],
+                    0,
+                    collection_url + "/Folders",
+                    verbose,
+                )
+            return self._json(entity, verbose)
+
+        return 404, {}, ""
+
+    def _add_to_folder(
+        self, folder_url: str, action: str, body: Any, verbose: bool
+    ) -> _Response:
+        match = re.match(r"/Folders/Add\('(.*)'\)$", action, re.IGNORECASE)
+        if match:
+            subfolder_url = f"{folder_url}/{match.group(1)}"
+            self.add_folder(subfolder_url)
+            return self._json(dict(self.folders[subfolder_url]), verbose)
+
+        match = re.match(
+            r"/Files/add\(overwrite=(\w+),url='(.*)'\)$", action, re.IGNORECASE
+        )
+        if match:
+            file_url = f"{folder_url}/{match.group(2)}"
+            if file_url in self.files and match.group(1) != "true":
+                return self._not_found(
+                    "-2130575257, Microsoft.SharePoint.SPException", verbose
+                )
+            if hasattr(body, "read"):
+                body = body.read()
+            content = body if isinstance(body, bytes) else (body or "").encode()
+            self.add_file(file_url, content)
+            return self._json(dict(self.files[file_url]), verbose)
+
+        return 404, {}, ""
+
+    def _batch(self, request: Any) -> _Response:
+        content_type = request.headers["Content-Type"]
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode()
+        message = message_from_bytes(
+            b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+        )
+        boundary = "batchresponse_" + uuid.uuid4().hex
+        parts = []
+        sub_parts: List[Message] = []
+        for part in cast(List[Message], message.get_payload()):
+            if part.is_multipart():
+                sub_parts.extend(cast(List[Message], part.get_payload()))
+            else:
+                sub_parts.append(part)
+        for part in sub_parts:
+            raw = cast(bytes, part.get_payload(decode=True)).decode()
+            head, _, sub_body = raw.replace("\r\n", "\n").partition("\n\n")
+            lines = head.splitlines()
+            method, target = lines[0].split(" ", 1)
+            url = target.rsplit(" ", 1)[0]
+            headers = {
+                k.strip(): v.strip()
+                for k, v in (line.split(":", 1) for line in lines[1:] if ":" in line)
+            }
+            status, resp_headers, resp_body = self._dispatch(
+                method, url, headers.get("Accept", ""), sub_body.strip() or None
+            )
+            if isinstance(resp_body, bytes):
+                resp_body = resp_body.decode()
+            status_line = f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}"
+            head_lines = [status_line]
+            head_lines += [f"{k}: {v}" for k, v in resp_headers.items()]
+            parts.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                "Content-Transfer-Encoding: binary\r\n\r\n"
+                + "\r\n".join(head_lines)
+                + "\r\n\r\n"
+                + resp_body
+                + "\r\n"
+            )
+        payload = "".join(parts) + f"--{boundary}--\r\n"
+        headers = {"Content-Type": f"multipart/mixed; boundary={boundary}"}
+        return 200, headers, payload
+
+    @staticmethod
+    def _select(item: Dict[str, Any], select: List[str], prefix: str) -> Dict[str, Any]:
+        fields = [f.split("/", 1)[1] for f in select if f.startswith(prefix + "/")]
+        if not fields:
+            return dict(item)
+        return {k: v for k, v in item.items() if k in fields}
+
+    def _page(
+        self, items: List[Dict[str, Any]], skip: int, url: str, verbose: bool
+    ) -> Dict[str, Any]:
+        end = len(items) if self.page_size is None else skip + self.page_size
+        page: Dict[str, Any] = {"results" if verbose else "value": items[skip:end]}
+        if end < len(items):
+            page["__next" if verbose else "odata.nextLink"] = f"{url}?$skiptoken={end}"
+        return page
+
+    @staticmethod
+    def _json(payload: Dict[str, Any], verbose: bool) -> _Response:
+        body = {"d": payload} if verbose else payload
+        content_type = "application/json;odata=" + (
+            "verbose" if verbose else "nometadata"
+        )
+        return 200, {"Content-Type": content_type}, json.dumps(body)
+
+    @staticmethod
+    def _auth_error(status: int, error: str, code: str) -> _Response:
+        body = {
+            "error": error,
+            "error_description": f"{code}: Invalid client credentials.",
+            "error_codes": [int(code[len("AADSTS") :])],
+            "timestamp": "2024-05-03 10:00:00Z",
+            "trace_id": str(uuid.uuid4()),
+            "correlation_id": str(uuid.uuid4()),
+            "error_uri": "https://accounts.accesscontrol.windows.net/error",
+        }
+        return status, {"Content-Type": "application/json"}, json.dumps(body)
+
+    @staticmethod
+    def _not_found(code: str, verbose: bool) -> _Response:
+        error = {"code": code, "message": {"lang": "en-US", "value": "nope"}}
+        if verbose:
+            headers = {"Content-Type": "application/json;odata=verbose"}
+            return 404, headers, json.dumps({"error": error})
+        headers = {"Content-Type": "application/json;odata=nometadata"}
+        return 404, headers, json.dumps({"odata.error": error})
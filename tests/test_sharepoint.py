@@ -1,7 +1,16 @@
+import hashlib
+import json
 import os
+import posixpath
 import tempfile
-from src.sharepoint import SharePoint
-import dotenv
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from src.client import SessionClientContext
+from src.sharepoint import (
+    _MAX_UPLOAD_CHUNK_SIZE,
+    _MIN_UPLOAD_CHUNK_SIZE,
+    SharePoint,
+)
 from src.error import (
     SPFolderNotFoundError,
     InvalidClientIDError,
@@ -9,89 +18,149 @@ from src.error import (
     InvalidSiteUrlError,
     SPFileNotFoundError,
     SPListNotFoundError,
+    SPFileAlreadyExistsError,
+    handle_client_request_error,
 )
+from office365.runtime.client_request_exception import ClientRequestException
 from office365.sharepoint.lists.list import List as SPList
 import pytest
 import logging
+import requests
 from office365.sharepoint.folders.folder import Folder
 from office365.sharepoint.files.file import File
-from typing import cast
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 from src.tree import FolderNode, Tree, FileNode
+from tests.fake_sharepoint import BASE_URL, CLIENT_ID, CLIENT_SECRET, FakeSharePoint
+
+@pytest.fixture(scope="session", autouse=True)
+def _silence_logs() -> Iterator[None]:
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session", name="sharepoint")
+def _sharepoint(
+    creds: Tuple[str, str, str], live: bool, tmp_path_factory: pytest.TempPathFactory
+) -> SharePoint:
+    if live:
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        token_cache_path = os.path.join(
+            os.path.expanduser("~"),
+            ".cache",
+            "sharepoint-tests",
+            f"token-{worker}.json",
+        )
+    else:
+        token_cache_path = str(tmp_path_factory.mktemp("token") / "token.json")
+
+    sharepoint = SharePoint(
+        *creds,
+        no_metadata=True,
+        token_cache_path=token_cache_path,
+    )
+    return sharepoint
 
-dotenv.load_dotenv()
 
-client_id = cast(str, os.getenv("CLIENT_ID"))
-client_secret = cast(str, os.getenv("CLIENT_SECRET"))
-base_url = cast(str, os.getenv("BASE_URL"))
+@pytest.fixture(name="fake_client")
+def _fake_client(fake_site: FakeSharePoint) -> SharePoint:
+    return SharePoint(BASE_URL, CLIENT_ID, CLIENT_SECRET, no_metadata=True)
 
-disable_loggers = ["src.error", "src.sharepoint"]
-for logger_name in disable_loggers:
-    logger = logging.getLogger(logger_name)
-    logger.disabled = True
 
+@pytest.fixture(scope="session", name="folder_tree")
+def _folder_tree(sharepoint: SharePoint) -> Callable[[str], Tree]:
+    trees: Dict[str, Tree] = {}
 
-@pytest.fixture(scope="session", autouse=True, name="sharepoint")
-def _sharepoint() -> SharePoint:
-    sharepoint = SharePoint(base_url, client_id, client_secret)
-    return sharepoint
+    def get_tree(folder_url: str) -> Tree:
+        if folder_url not in trees:
+            trees[folder_url] = sharepoint._get_folder_contents(
+                folder_url, recursive=True
+            )
+        return trees[folder_url]
+
+    return get_tree
 
 
-@pytest.mark.skip(reason="Already tested")
 def test_auth_correct(sharepoint: SharePoint) -> None:
     sharepoint._connect()
     assert sharepoint.is_connected is True
 
 
-@pytest.mark.skip(reason="Already tested")
-def test_auth_invalid_client_id() -> None:
-    with pytest.raises(InvalidClientIDError):
-        SharePoint(base_url, "askldjaskl", client_secret)._connect()
+def test_auth_cached_token(
+    creds: Tuple[str, str, str],
+    tmp_path,
+    sent_requests: List[requests.PreparedRequest],
+) -> None:
+    base_url, client_id, client_secret = creds
+    cache_path = str(tmp_path / "token.json")
+    SharePoint(
+        base_url, client_id, client_secret, token_cache_path=cache_path
+    )._connect()
+
+    sent_requests.clear()
+
+    sharepoint = SharePoint(
+        base_url, client_id, client_secret, token_cache_path=cache_path
+    )
+    sharepoint._connect()
+
+    assert sharepoint.is_connected is True
+    assert sent_requests == []
+
+
+def test_shared_session(sharepoint: SharePoint) -> None:
+    sharepoint._connect()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        worker_ctx = executor.submit(sharepoint._worker_ctx).result()
 
+    assert cast(SessionClientContext, sharepoint.ctx).session is sharepoint._session
+    assert cast(SessionClientContext, worker_ctx).session is sharepoint._session
 
-@pytest.mark.skip(reason="Already tested")
-def test_auth_invalid_client_secret() -> None:
-    with pytest.raises(InvalidClientSecretError):
-        SharePoint(base_url, client_id, "askldjaskl")._connect()
 
+def test_auth_invalid_client_id(mocked_acs: FakeSharePoint) -> None:
+    with pytest.raises(InvalidClientIDError) as exc_info:
+        SharePoint(BASE_URL, "askldjaskl", CLIENT_SECRET)._connect()
+    assert exc_info.value.error_details["error"] == "unauthorized_client"
 
-@pytest.mark.skip(reason="Already tested")
-def test_invalid_both_id_secret() -> None:
+
+def test_auth_invalid_client_secret(mocked_acs: FakeSharePoint) -> None:
+    with pytest.raises(InvalidClientSecretError) as exc_info:
+        SharePoint(BASE_URL, CLIENT_ID, "askldjaskl")._connect()
+    assert exc_info.value.error_details["error"] == "invalid_client"
+
+
+def test_invalid_both_id_secret(mocked_acs: FakeSharePoint) -> None:
     with pytest.raises(InvalidClientIDError):
-        SharePoint(base_url, "askldjaskl", "askldjaskl")._connect()
+        SharePoint(BASE_URL, "askldjaskl", "askldjaskl")._connect()
 
 
-@pytest.mark.skip(reason="Already tested")
-def test_auth_invalid_site_url() -> None:
+def test_auth_invalid_site_url(mocked_acs: FakeSharePoint) -> None:
     with pytest.raises(InvalidSiteUrlError):
         SharePoint("https://akldjaskl.sharepoint.com", "something", "secret")._connect()
 
 
-@pytest.mark.skip(reason="Already tested")
 def test_folder(sharepoint: SharePoint) -> None:
     folder = sharepoint._folder("/Shared Documents")
     assert isinstance(folder, Folder) and folder.exists is True
 
 
-@pytest.mark.skip(reason="Already tested")
 def test_unknown_folder(sharepoint: SharePoint) -> None:
     with pytest.raises(SPFolderNotFoundError):
         sharepoint._folder("/Shared Documents/askldjaskl")
 
 
-@pytest.mark.skip(reason="Already tested")
 def test_file(sharepoint: SharePoint) -> None:
     file = sharepoint._file("/Shared Documents/Rekvizity (1).docx")
     assert isinstance(file, File) and file.exists is True
 
 
-@pytest.mark.skip(reason="Already tested")
 def test_unknown_file(sharepoint: SharePoint) -> None:
     with pytest.raises(SPFileNotFoundError):
         sharepoint._file("/Shared Documents/asdkljaskl.docx")
 
 
-@pytest.mark.skip(reason="Already tested")
 def test_list(sharepoint: SharePoint) -> None:
     list_object = sharepoint._list("TestList")
     assert (
@@ -100,54 +169,146 @@ def test_list(sharepoint: SharePoint) -> None:
     )
 
 
-@pytest.mark.skip(reason="Already tested")
 def test_unknown_list(sharepoint: SharePoint) -> None:
     with pytest.raises(SPListNotFoundError):
         sharepoint._list("askldjaskl")
 
 
-@pytest.mark.skip(reason="Already tested")
-def test_get_folder_contents(sharepoint: SharePoint) -> None:
-    tree = sharepoint._get_folder_contents("/Shared Documents/Test_03-05-2024")
-    assert isinstance(tree, Tree)
+@pytest.mark.parametrize("envelope", ["error", "odata.error"])
+def test_client_request_error_envelope(envelope: str) -> None:
+    error = {
+        "code": "-2147024894, System.IO.FileNotFoundException",
+        "message": {"lang": "en-US", "value": "File Not Found."},
+    }
+    response = requests.Response()
+    response.status_code = 404
+    response.headers["Content-Type"] = "application/json;odata=nometadata"
+    response._content = json.dumps({envelope: error}).encode()
 
-    tree_length = 0
-    for node in tree:
-        assert isinstance(node, (FileNode, FolderNode))
-        assert node.name is not None
-        tree_length += 1
+    exc = handle_client_request_error(
+        ClientRequestException("404 Client Error", response=response)
+    )
+
+    assert isinstance(exc, SPFolderNotFoundError)
+    assert exc.error_details["exception_name"] == "System.IO.FileNotFoundException"
+    assert exc.error_details["message"] == "File Not Found."
 
-    assert tree_length == len(tree)
 
+def _node_obj(node_type: type, path: str) -> Any:
+    obj = node_type(None)
+    obj.properties.update(Name=posixpath.basename(path), ServerRelativeUrl=path)
+    return obj
 
-@pytest.mark.skip(reason="Already tested")
-def test_list_folder_contents_recursive(sharepoint: SharePoint) -> None:
+
+def test_tree_to_dict() -> None:
+    root = FolderNode(_node_obj(Folder, "/root"))
+    inner = FolderNode(
+        _node_obj(Folder, "/root/sub/inner"),
+        children=[FileNode(_node_obj(File, "/root/sub/inner/c.txt"), parent=root)],
+    )
+    sub = FolderNode(_node_obj(Folder, "/root/sub"), children=[inner])
+    root.add_child(FileNode(_node_obj(File, "/root/a.txt"), parent=root))
+    root.add_child(sub)
+    root.children.append(FileNode(_node_obj(File, "/root/b.txt"), parent=sub))
+
+    assert Tree(root).to_dict() == {
+        "name": "root",
+        "path": "/root",
+        "type": "folder",
+        "children": [
+            {"name": "a.txt", "path": "/root/a.txt", "type": "file"},
+            {
+                "name": "sub",
+                "path": "/root/sub",
+                "type": "folder",
+                "children": [
+                    {
+                        "name": "inner",
+                        "path": "/root/sub/inner",
+                        "type": "folder",
+                        "children": [
+                            {
+                                "name": "c.txt",
+                                "path": "/root/sub/inner/c.txt",
+                                "type": "file",
+                            }
+                        ],
+                    }
+                ],
+            },
+            {"name": "b.txt", "path": "/root/b.txt", "type": "file"},
+        ],
+    }
+
+
+def test_get_folder_contents(folder_tree: Callable[[str], Tree]) -> None:
+    tree = folder_tree("/Shared Documents/Test_03-05-2024")
+    assert isinstance(tree, Tree)
+
+    nodes = list(tree)
+    assert all(isinstance(node, (FileNode, FolderNode)) for node in nodes)
+    assert all(node.name is not None for node in nodes)
+    assert len(nodes) == len(tree)
+
+
+def test_list_folder_contents_recursive(folder_tree: Callable[[str], Tree]) -> None:
     folder_url = "/Shared Documents"
-    tree = sharepoint._get_folder_contents(folder_url, recursive=True)
+    tree = folder_tree(folder_url)
 
     assert isinstance(tree, Tree)
 
-    tree_length = 0
-    for node in tree:
-        assert isinstance(node, (FileNode, FolderNode))
-        assert node.name is not None
-        tree_length += 1
-    assert tree_length == len(tree)
+    nodes = list(tree)
+    assert all(isinstance(node, (FileNode, FolderNode)) for node in nodes)
+    assert all(node.name is not None for node in nodes)
+    assert len(nodes) == len(tree)
 
     assert tree.depth > 1
 
 
-@pytest.mark.skip(reason="Already tested")
-def test_list_folder_contents(sharepoint: SharePoint) -> None:
+def test_traversal_fills_cache(
+    sharepoint: SharePoint, sent_requests: List[requests.PreparedRequest]
+) -> None:
+    sharepoint._cache.clear()
+    tree = sharepoint._get_folder_contents(
+        "/Shared Documents/Test_03-05-2024", recursive=True
+    )
+    nodes = [node for node in tree if node is not tree.root]
+    assert any(node.is_folder() for node in nodes)
+
+    sent_requests.clear()
+
+    for node in nodes:
+        if node.is_folder():
+            assert sharepoint._folder(node.path).properties["Name"] == node.name
+        else:
+            assert sharepoint._file(node.path).properties["Name"] == node.name
+
+    assert sent_requests == []
+
+
+def test_list_folder_contents(
+    sharepoint: SharePoint, monkeypatch: pytest.MonkeyPatch
+) -> None:
     folder_url = "/Shared Documents/Test_03-05-2024"
+    tree = sharepoint._get_folder_contents(folder_url)
+
+    calls = []
+
+    def _get_folder_contents(folder_url: str, recursive: bool = False) -> Tree:
+        calls.append((folder_url, recursive))
+        return tree
+
+    monkeypatch.setattr(sharepoint, "_get_folder_contents", _get_folder_contents)
     contents = sharepoint.list_folder_contents(folder_url)
 
     assert isinstance(contents, dict)
-    assert contents == sharepoint._get_folder_contents(folder_url).to_dict()
+    assert contents == tree.to_dict()
+    assert calls == [(folder_url, False)]
 
 
-@pytest.mark.skip(reason="Already tested")
-def test_list_subfolders(sharepoint: SharePoint) -> None:
+def test_list_subfolders(
+    sharepoint: SharePoint, folder_tree: Callable[[str], Tree]
+) -> None:
     folder_url = "/Shared Documents/Test_03-05-2024"
     subfolders = sharepoint.list_subfolders(folder_url)
 
@@ -155,11 +316,19 @@ def test_list_subfolders(sharepoint: SharePoint) -> None:
 
     assert all(isinstance(folder, str) for folder in subfolders)
 
+    tree = folder_tree(folder_url)
+    assert sorted(cast(List[str], subfolders)) == sorted(
+        node.path for node in tree.root.children if node.is_folder()
+    )
 
-@pytest.mark.skip(reason="Already tested")
-def test_list_subfolders_with_properties(sharepoint: SharePoint) -> None:
+
+def test_list_subfolders_with_properties(
+    sharepoint: SharePoint, folder_tree: Callable[[str], Tree]
+) -> None:
     folder_url = "/Shared Documents/Test_03-05-2024"
-    subfolders = sharepoint.list_subfolders(folder_url, include_properties=True)
+    subfolders = sharepoint.list_subfolders(
+        folder_url, include_properties=True, fields=["Name", "ServerRelativeUrl"]
+    )
 
     assert isinstance(subfolders, list)
 
@@ -168,9 +337,15 @@ def test_list_subfolders_with_properties(sharepoint: SharePoint) -> None:
     assert all("Name" in folder for folder in subfolders)
     assert all("ServerRelativeUrl" in folder for folder in subfolders)
 
+    tree = folder_tree(folder_url)
+    assert sorted(cast(dict, folder)["Name"] for folder in subfolders) == sorted(
+        node.name for node in tree.root.children if node.is_folder()
+    )
+
 
-@pytest.mark.skip(reason="Already tested")
-def test_list_files(sharepoint: SharePoint) -> None:
+def test_list_files(
+    sharepoint: SharePoint, folder_tree: Callable[[str], Tree]
+) -> None:
     folder_url = "/Shared Documents/Test_03-05-2024"
     files = sharepoint.list_files(folder_url)
 
@@ -178,11 +353,50 @@ def test_list_files(sharepoint: SharePoint) -> None:
 
     assert all(isinstance(file, str) for file in files)
 
+    tree = folder_tree(folder_url)
+    assert sorted(cast(List[str], files)) == sorted(
+        node.path for node in tree.root.children if node.is_file()
+    )
+
+
+def test_list_files_with_properties(
+    sharepoint: SharePoint, sent_requests: List[requests.PreparedRequest]
+) -> None:
+    folder_url = "/Shared Documents/Test_03-05-2024"
+    files = sharepoint.list_files(
+        folder_url,
+        include_properties=True,
+        fields=["Name", "ServerRelativeUrl", "Length"],
+    )
+
+    assert isinstance(files, list)
+
+    assert all(isinstance(file, dict) for file in files)
+
+    assert all("Name" in file for file in files)
+    assert all("ServerRelativeUrl" in file for file in files)
+    assert all("Length" in file for file in files)
+
+    sent_requests.clear()
+
+    file_urls = [cast(dict, file)["ServerRelativeUrl"] for file in files]
+    batched_files = sharepoint.get_files_batch(file_urls)
+
+    api_urls = [
+        request.url
+        for request in sent_requests
+        if not request.url.endswith("/contextInfo")
+    ]
+    assert len(api_urls) == 1 and api_urls[0].endswith("/$batch")
+
+    for file, batched_file in zip(files, batched_files):
+        for key in ("Name", "ServerRelativeUrl", "Length"):
+            assert cast(dict, file)[key] == batched_file.properties[key]
+
 
-@pytest.mark.skip(reason="Already tested")
-def test_list_files_with_properties(sharepoint: SharePoint) -> None:
+def test_list_files_via_items(sharepoint: SharePoint) -> None:
     folder_url = "/Shared Documents/Test_03-05-2024"
-    files = sharepoint.list_files(folder_url, include_properties=True)
+    files = sharepoint.list_files_via_items("Documents", include_properties=True)
 
     assert isinstance(files, list)
 
@@ -192,8 +406,21 @@ def test_list_files_with_properties(sharepoint: SharePoint) -> None:
     assert all("ServerRelativeUrl" in file for file in files)
     assert all("Length" in file for file in files)
 
+    file_urls = {cast(dict, file)["ServerRelativeUrl"] for file in files}
+    assert set(cast(list, sharepoint.list_files(folder_url))) <= file_urls
+
+
+def test_no_metadata_accept_header(
+    sharepoint: SharePoint, sent_requests: List[requests.PreparedRequest]
+) -> None:
+    sharepoint._cache.clear()
+    files = sharepoint.list_files("/Shared Documents/Test_03-05-2024")
+
+    assert isinstance(files, list)
+    accept_headers = [request.headers.get("Accept") for request in sent_requests]
+    assert "application/json;odata=nometadata" in accept_headers
+
 
-@pytest.mark.skip(reason="Already tested")
 def test_read_file(sharepoint: SharePoint) -> None:
     file_url = "/Shared Documents/Rekvizity (1).docx"
     file = sharepoint.read_file(file_url)
@@ -202,20 +429,247 @@ def test_read_file(sharepoint: SharePoint) -> None:
     assert len(file) > 0
 
 
-@pytest.mark.skip(reason="Already tested")
-def test_download_file(sharepoint: SharePoint) -> None:
+def test_read_unknown_file(sharepoint: SharePoint) -> None:
+    with pytest.raises(SPFileNotFoundError):
+        sharepoint.read_file("/Shared Documents/asdkljaskl.docx")
+
+
+def _sha256(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def test_download_file(
+    sharepoint: SharePoint, fake_sharepoint: Optional[FakeSharePoint]
+) -> None:
     file_url = "/Shared Documents/Rekvizity (1).docx"
-    download_path = os.path.join(tempfile.gettempdir(), file_url.split("/")[-1])
+    download_path = os.path.join(tempfile.gettempdir(), posixpath.basename(file_url))
 
-    sharepoint.download_file(file_url, download_path)
+    digest = sharepoint.download_file(file_url, download_path)
 
-    with open(download_path, "rb") as f:
-        temp_file_content = f.read()
+    assert os.path.getsize(download_path) > 0
+    assert _sha256(download_path) == digest
+    if fake_sharepoint is not None:
+        content = fake_sharepoint.contents[file_url]
+        assert digest == hashlib.sha256(content).hexdigest()
 
-    assert isinstance(temp_file_content, bytes)
-    assert len(temp_file_content) > 0
+    os.remove(download_path)
 
-    target_file = sharepoint.read_file(file_url)
-    assert temp_file_content == target_file
+    assert (
+        sharepoint.download_file_multipart(file_url, download_path, parts=1) == digest
+    )
+    assert _sha256(download_path) == digest
+    os.remove(download_path)
+
+    assert (
+        sharepoint.download_file_multipart(file_url, download_path, parts=4) == digest
+    )
+    assert _sha256(download_path) == digest
 
     os.remove(download_path)
+
+
+def test_download_unknown_file(sharepoint: SharePoint, tmp_path) -> None:
+    download_path = str(tmp_path / "asdkljaskl.docx")
+
+    with pytest.raises(SPFileNotFoundError):
+        sharepoint.download_file("/Shared Documents/asdkljaskl.docx", download_path)
+
+    assert not os.path.exists(download_path)
+
+
+def test_download_files(sharepoint: SharePoint) -> None:
+    folder_url = "/Shared Documents/Test_03-05-2024"
+    file_urls = cast(list, sharepoint.list_files(folder_url))
+    assert len(file_urls) > 0
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = [
+            (file_url, os.path.join(temp_dir, f"{i}_{posixpath.basename(file_url)}"))
+            for i, file_url in enumerate(file_urls)
+        ]
+        sharepoint.download_files(files)
+
+        target_files = sharepoint.read_files(file_urls)
+        for file_url, download_path in files:
+            with open(download_path, "rb") as f:
+                assert f.read() == target_files[file_url]
+
+
+@pytest.mark.parametrize("no_metadata", [False, True])
+def test_paged_folder_contents(fake_site: FakeSharePoint, no_metadata: bool) -> None:
+    fake_site.page_size = 1
+    sharepoint = SharePoint(
+        BASE_URL, CLIENT_ID, CLIENT_SECRET, no_metadata=no_metadata
+    )
+    folder_url = "/Shared Documents/Test_03-05-2024"
+
+    tree = sharepoint._get_folder_contents(folder_url, recursive=True)
+    assert sorted(node.path for node in tree if node is not tree.root) == sorted(
+        url
+        for url in [*fake_site.folders, *fake_site.files]
+        if url.startswith(folder_url + "/")
+    )
+
+    files = sharepoint.list_files_via_items("Documents")
+    assert sorted(cast(list, files)) == sorted(fake_site.files)
+    assert any("$skiptoken=" in url for _, url in fake_site.requests)
+
+
+def test_create_folder_and_upload_file(
+    fake_site: FakeSharePoint, fake_client: SharePoint, tmp_path
+) -> None:
+    folder_url = fake_client.create_folder("/Shared Documents", "Uploads")
+    assert folder_url == "/Shared Documents/Uploads"
+    assert folder_url in fake_site.folders
+
+    local_file_path = tmp_path / "report.txt"
+    local_file_path.write_bytes(b"report")
+
+    file_url = fake_client.upload_file(folder_url, str(local_file_path))
+    assert file_url == "/Shared Documents/Uploads/report.txt"
+    assert fake_site.contents[file_url] == b"report"
+
+    with pytest.raises(SPFileAlreadyExistsError):
+        fake_client.upload_file(folder_url, str(local_file_path))
+
+
+def test_download_file_multipart_without_ranges(
+    fake_site: FakeSharePoint, fake_client: SharePoint, tmp_path
+) -> None:
+    fake_site.ranges = False
+    file_url = "/Shared Documents/Rekvizity (1).docx"
+    download_path = str(tmp_path / posixpath.basename(file_url))
+
+    digest = fake_client.download_file_multipart(file_url, download_path, parts=4)
+
+    content = fake_site.contents[file_url]
+    with open(download_path, "rb") as f:
+        assert f.read() == content
+    assert digest == hashlib.sha256(content).hexdigest()
+    assert sum(url.endswith("/$value") for _, url in fake_site.requests) == 1
+
+
+def test_download_file_multipart_failure(
+    fake_client: SharePoint, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    file_url = "/Shared Documents/Rekvizity (1).docx"
+    download_path = str(tmp_path / posixpath.basename(file_url))
+
+    def _download_range_concurrent(*args: Any) -> None:
+        raise requests.ConnectionError("Connection reset")
+
+    monkeypatch.setattr(
+        fake_client, "_download_range_concurrent", _download_range_concurrent
+    )
+
+    with pytest.raises(requests.ConnectionError):
+        fake_client.download_file_multipart(file_url, download_path, parts=4)
+
+    assert not os.path.exists(download_path)
+
+
+def test_upload_folder(
+    fake_site: FakeSharePoint, fake_client: SharePoint, tmp_path
+) -> None:
+    local_folder = tmp_path / "Batch"
+    (local_folder / "nested" / "deeper").mkdir(parents=True)
+    (local_folder / "empty").mkdir()
+    (local_folder / "top.txt").write_bytes(b"top")
+    (local_folder / "nested" / "mid.txt").write_bytes(b"mid")
+    (local_folder / "nested" / "deeper" / "low.txt").write_bytes(b"low")
+
+    root_url = fake_client.upload_folder("/Shared Documents", str(local_folder))
+
+    assert root_url == "/Shared Documents/Batch"
+    assert {url for url in fake_site.folders if url.startswith(root_url)} == {
+        root_url,
+        f"{root_url}/empty",
+        f"{root_url}/nested",
+        f"{root_url}/nested/deeper",
+    }
+    assert {
+        url: content
+        for url, content in fake_site.contents.items()
+        if url.startswith(root_url)
+    } == {
+        f"{root_url}/top.txt": b"top",
+        f"{root_url}/nested/mid.txt": b"mid",
+        f"{root_url}/nested/deeper/low.txt": b"low",
+    }
+
+
+def test_download_folder(
+    fake_site: FakeSharePoint, fake_client: SharePoint, tmp_path
+) -> None:
+    folder_url = "/Shared Documents/Test_03-05-2024"
+    output_zip_file = str(tmp_path / "folder.zip")
+
+    fake_client.download_folder(folder_url, output_zip_file, recursive=True)
+
+    with zipfile.ZipFile(output_zip_file) as zf:
+        contents = {name: zf.read(name) for name in zf.namelist()}
+    assert contents == {
+        url.lstrip("/"): content
+        for url, content in fake_site.contents.items()
+        if url.startswith(folder_url + "/")
+    }
+
+
+def test_download_folder_failure(
+    fake_client: SharePoint, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    output_zip_file = str(tmp_path / "folder.zip")
+    spool_file = fake_client._spool_file_concurrent
+    spooled_files = []
+
+    def _spool_file_concurrent(file_url: str) -> IO[bytes]:
+        if file_url.endswith("/notes.txt"):
+            raise SPFileNotFoundError(
+                {
+                    "code": "-2130575338",
+                    "exception_name": "Microsoft.SharePoint.SPException",
+                    "message": "File not found",
+                    "exception_details": "",
+                }
+            )
+        spooled_file = spool_file(file_url)
+        spooled_files.append(spooled_file)
+        return spooled_file
+
+    monkeypatch.setattr(fake_client, "_spool_file_concurrent", _spool_file_concurrent)
+
+    with pytest.raises(SPFileNotFoundError):
+        fake_client.download_folder(
+            "/Shared Documents/Test_03-05-2024", output_zip_file, recursive=True
+        )
+
+    assert not os.path.exists(output_zip_file)
+    assert spooled_files and all(f.closed for f in spooled_files)
+
+
+def test_upload_chunk_size_for() -> None:
+    assert SharePoint._upload_chunk_size_for(0.001) == _MIN_UPLOAD_CHUNK_SIZE
+    assert SharePoint._upload_chunk_size_for(0.1) == 6_250_000
+    assert SharePoint._upload_chunk_size_for(60.0) == _MAX_UPLOAD_CHUNK_SIZE
+
+
+def test_upload_file_skips_rtt_probe(
+    fake_site: FakeSharePoint,
+    fake_client: SharePoint,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    probes = []
+    monkeypatch.setattr(fake_client, "_measure_rtt", lambda: probes.append(1))
+
+    local_file_path = tmp_path / "medium.bin"
+    local_file_path.write_bytes(b"\0" * (_MIN_UPLOAD_CHUNK_SIZE + 1))
+
+    file_url = fake_client.upload_file("/Shared Documents", str(local_file_path))
+
+    assert fake_site.contents[file_url] == local_file_path.read_bytes()
+    assert probes == []